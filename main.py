@@ -3,7 +3,7 @@ import redis.asyncio as redis
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_limiter import FastAPILimiter
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
 from src.routes import contacts, auth, users
@@ -49,7 +49,7 @@ def read_root():
     return {"message": "Hello World"}
 
 @app.get("/api/healthchecker")
-def healthchecker(db: Session = Depends(get_db)) -> dict:
+async def healthchecker(db: AsyncSession = Depends(get_db)) -> dict:
     """
     Creates the '/api/healthchecker' route to check the health 
     of the database.
@@ -62,7 +62,7 @@ def healthchecker(db: Session = Depends(get_db)) -> dict:
     with code 500 and the message "Error connecting to the database"
 
     :param db: The database session.
-    :type db: Session
+    :type db: AsyncSession
     :return: The returns message: "Welcome to FastAPI!",
         if the connection to the database is established,
         or an exception otherwise is thrown with code 500
@@ -71,7 +71,7 @@ def healthchecker(db: Session = Depends(get_db)) -> dict:
     """
     try:
         # Make request
-        result = db.execute(text("SELECT 1")).fetchone()
+        result = (await db.execute(text("SELECT 1"))).fetchone()
         if result is None:
             raise HTTPException(status_code=500, detail="Database is not configured correctly")
         return {"message": "Welcome to FastAPI!"}
@@ -0,0 +1,24 @@
+"""Covering index for contact pagination
+
+Revision ID: 4cf0a96d2b17
+Revises: e59c20c7d1f3
+Create Date: 2026-08-28 12:02:36.671808
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4cf0a96d2b17'
+down_revision = 'e59c20c7d1f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_contacts_user_id', 'contacts', ['user_id', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_user_id', table_name='contacts')
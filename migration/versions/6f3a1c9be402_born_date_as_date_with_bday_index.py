@@ -0,0 +1,41 @@
+"""Born date as date with bday index
+
+Revision ID: 6f3a1c9be402
+Revises: 92a427875c4a
+Create Date: 2026-08-28 10:12:44.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6f3a1c9be402'
+down_revision = '92a427875c4a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column('contacts', 'born_date',
+                    existing_type=sa.String(length=100),
+                    type_=sa.Date(),
+                    existing_nullable=False,
+                    postgresql_using="to_date(born_date, 'YYYY-MM-DD')")
+    op.add_column('contacts', sa.Column('born_month', sa.SmallInteger(), nullable=True))
+    op.add_column('contacts', sa.Column('born_day', sa.SmallInteger(), nullable=True))
+    op.execute("UPDATE contacts SET born_month = extract(month from born_date), "
+               "born_day = extract(day from born_date)")
+    op.alter_column('contacts', 'born_month', existing_type=sa.SmallInteger(), nullable=False)
+    op.alter_column('contacts', 'born_day', existing_type=sa.SmallInteger(), nullable=False)
+    op.create_index('ix_contacts_bday', 'contacts', ['user_id', 'born_month', 'born_day'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_bday', table_name='contacts')
+    op.drop_column('contacts', 'born_day')
+    op.drop_column('contacts', 'born_month')
+    op.alter_column('contacts', 'born_date',
+                    existing_type=sa.Date(),
+                    type_=sa.String(length=100),
+                    existing_nullable=False)
@@ -0,0 +1,30 @@
+"""Server default for contacts created_at
+
+Revision ID: 9d84b7e6a20c
+Revises: 4cf0a96d2b17
+Create Date: 2026-08-28 14:47:55.382911
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d84b7e6a20c'
+down_revision = '4cf0a96d2b17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column('contacts', 'created_at',
+                    existing_type=sa.DateTime(),
+                    existing_nullable=False,
+                    server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    op.alter_column('contacts', 'created_at',
+                    existing_type=sa.DateTime(),
+                    existing_nullable=False,
+                    server_default=None)
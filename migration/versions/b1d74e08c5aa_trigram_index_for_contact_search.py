@@ -0,0 +1,26 @@
+"""Trigram index for contact search
+
+Revision ID: b1d74e08c5aa
+Revises: 6f3a1c9be402
+Create Date: 2026-08-28 11:05:17.530266
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b1d74e08c5aa'
+down_revision = '6f3a1c9be402'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE INDEX ix_contacts_trgm ON contacts "
+               "USING gin ((first_name || ' ' || last_name || ' ' || email) gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX ix_contacts_trgm")
@@ -0,0 +1,34 @@
+"""Phone number as string with index
+
+Revision ID: e59c20c7d1f3
+Revises: b1d74e08c5aa
+Create Date: 2026-08-28 11:31:02.904481
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e59c20c7d1f3'
+down_revision = 'b1d74e08c5aa'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column('contacts', 'phone_number',
+                    existing_type=sa.Integer(),
+                    type_=sa.String(length=32),
+                    existing_nullable=False,
+                    postgresql_using='phone_number::text')
+    op.create_index('ix_contacts_phone', 'contacts', ['phone_number'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_phone', table_name='contacts')
+    op.alter_column('contacts', 'phone_number',
+                    existing_type=sa.String(length=32),
+                    type_=sa.Integer(),
+                    existing_nullable=False,
+                    postgresql_using='phone_number::integer')
@@ -1,23 +1,18 @@
 
 
-from sqlalchemy import *
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from src.conf.config import settings
 
 SQLALCHEMY_DATABASE_URL = settings.sqlalchemy_database_url
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
+if SQLALCHEMY_DATABASE_URL.startswith("postgresql://"):
+    SQLALCHEMY_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace(
+        "postgresql://", "postgresql+asyncpg://", 1)
 
+engine = create_async_engine(SQLALCHEMY_DATABASE_URL, query_cache_size=1200)
 
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
+async def get_db():
+    async with SessionLocal() as db:
+        yield db
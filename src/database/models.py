@@ -1,35 +1,53 @@
-from sqlalchemy import Column, String, Integer, func, Boolean, Table
-from sqlalchemy.orm import relationship
+from datetime import date, datetime
+
+from sqlalchemy import String, SmallInteger, func, Index
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, validates
 from sqlalchemy.sql.schema import ForeignKey
-from sqlalchemy.sql.sqltypes import DateTime
-from sqlalchemy.ext.declarative import declarative_base
 
 
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
+
 
 class Contacts(Base):
     __tablename__ = "contacts"
-    id = Column(Integer, primary_key=True)
-    first_name = Column(String(100), nullable=False )
-    last_name = Column(String(100), nullable=False )
-    phone_number = Column(Integer, nullable=False)
-    born_date = Column(String(100), nullable=False)
-    email = Column(String(50), nullable=False)
-    description = Column(String(250))
-    created_at = Column(DateTime, nullable=False )
-    done = Column(Boolean, default=False)
-    user_id = Column('user_id', ForeignKey('users.id', ondelete='CASCADE'), default=None)
-    user = relationship('User', backref='contacts')
-    
+    __table_args__ = (
+        Index('ix_contacts_bday', 'user_id', 'born_month', 'born_day'),
+        Index('ix_contacts_phone', 'phone_number'),
+        Index('ix_contacts_user_id', 'user_id', 'id'),
+    )
+    id: Mapped[int] = mapped_column(primary_key=True)
+    first_name: Mapped[str] = mapped_column(String(100))
+    last_name: Mapped[str] = mapped_column(String(100))
+    phone_number: Mapped[str] = mapped_column(String(32))
+    born_date: Mapped[date]
+    born_month: Mapped[int] = mapped_column(SmallInteger)
+    born_day: Mapped[int] = mapped_column(SmallInteger)
+    email: Mapped[str] = mapped_column(String(50))
+    description: Mapped[str | None] = mapped_column(String(250))
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
+    done: Mapped[bool | None] = mapped_column(default=False)
+    user_id: Mapped[int | None] = mapped_column(ForeignKey('users.id', ondelete='CASCADE'), default=None)
+    user: Mapped['User'] = relationship(back_populates='contacts', lazy='raise')
+
+    @validates('born_date')
+    def _fill_born_month_day(self, key, value):
+        if isinstance(value, str):
+            value = date.fromisoformat(value)
+        if value is not None:
+            self.born_month = value.month
+            self.born_day = value.day
+        return value
 
 
 class User(Base):
     __tablename__ = "users"
-    id = Column(Integer, primary_key=True)
-    username = Column(String(50))
-    email = Column(String(250), nullable=False, unique=True)
-    password = Column(String(255), nullable=False)
-    created_at = Column('crated_at', DateTime, default=func.now())
-    avatar = Column(String(255), nullable=True)
-    refresh_token = Column(String(255), nullable=True)
-    confirmed = Column(Boolean, default=False)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    username: Mapped[str | None] = mapped_column(String(50))
+    email: Mapped[str] = mapped_column(String(250), unique=True)
+    password: Mapped[str] = mapped_column(String(255))
+    created_at: Mapped[datetime | None] = mapped_column('crated_at', default=func.now())
+    avatar: Mapped[str | None] = mapped_column(String(255))
+    refresh_token: Mapped[str | None] = mapped_column(String(255))
+    confirmed: Mapped[bool | None] = mapped_column(default=False)
+    contacts: Mapped[list['Contacts']] = relationship(back_populates='user', lazy='raise')
@@ -1,41 +1,105 @@
+import json
 from typing import List
-from datetime import datetime, date, timedelta
+from datetime import date, timedelta
 
-from sqlalchemy import and_, or_, extract
-from sqlalchemy.orm import Session
+import redis.asyncio as redis
+from sqlalchemy import and_, or_, tuple_, select, insert, update, delete, bindparam, literal_column
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.conf.config import settings
 from src.database.models import Contacts, User
 from src.schemas import ContactsModel, ContactsUpdate, ContactsStatusUpdate
 
+_redis = redis.Redis(host=settings.redis_host, port=settings.redis_port, db=0)
+_PAGE_TTL = 30
 
-async def get_contacts(skip: int, limit: int,user: User, db: Session) -> List[Contacts]:
+
+def _page_key(user_id: int, after_id: int | None, limit: int) -> str:
+    return f"contacts:{user_id}:{after_id or 0}:{limit}"
+
+
+# The cache is best-effort: if Redis is down, reads fall through to the
+# database and writes skip invalidation instead of failing the request.
+async def _invalidate_pages(user_id: int) -> None:
+    try:
+        async for key in _redis.scan_iter(f"contacts:{user_id}:*"):
+            await _redis.delete(key)
+    except Exception as e:
+        print(e)
+
+
+# Statements built once at import time: SQLAlchemy caches the compiled SQL
+# keyed by the statement object, so repeated calls skip recompilation.
+# Keyset pagination: 'after' is the last contact id of the previous page, so
+# the planner walks ix_contacts_user_id instead of skipping OFFSET rows.
+# Only the columns ContactsResponse serializes: narrower rows off the wire
+# and no ORM instances to build for the list endpoint.
+_GET_CONTACTS = select(
+    Contacts.id, Contacts.first_name, Contacts.last_name, Contacts.email,
+    Contacts.phone_number, Contacts.born_date, Contacts.description,
+    Contacts.done, Contacts.created_at).where(
+    Contacts.user_id == bindparam('uid'), Contacts.id > bindparam('after')) \
+    .order_by(Contacts.id).limit(bindparam('lm'))
+# Single ILIKE over the concatenated name/email matches the pg_trgm GIN
+# expression index ix_contacts_trgm instead of forcing a sequential scan.
+# The separators must render as inline literals, not bind parameters:
+# Postgres matches expression indexes structurally, so the compiled SQL has
+# to read exactly first_name || ' ' || last_name || ' ' || email.
+_SPACE = literal_column("' '")
+_SEARCH_CONTACTS = select(Contacts).where(
+    Contacts.user_id == bindparam('uid'),
+    (Contacts.first_name + _SPACE + Contacts.last_name + _SPACE + Contacts.email).ilike(bindparam('q')),
+)
+
+
+async def get_contacts(after_id: int | None, limit: int, user: User, db: AsyncSession) -> List[dict]:
     """
-    The get_contacts function returns a list of contacts for the user.
+    The get_contacts function returns a page of contacts for the user,
+    ordered by id and starting after the given id. Pages are served from
+    a short-TTL Redis cache when possible; writes to the user's contacts
+    invalidate the cached pages.
 
-    :param skip: int: Skip the first n contacts
+    :param after_id: int | None: Return contacts with an id greater than this
     :param limit: int: Limit the number of contacts returned
     :param user: User: Filter the contacts by user
-    :param db: Session: Pass the database session to the function
-    :return: A list of contacts
+    :param db: AsyncSession: Pass the database session to the function
+    :return: A list of contact row mappings
     """
-    return db.query(Contacts).filter(Contacts.user_id == user.id).offset(skip).limit(limit).all()
+    key = _page_key(user.id, after_id, limit)
+    try:
+        cached = await _redis.get(key)
+    except Exception as e:
+        print(e)
+        cached = None
+    if cached is not None:
+        return json.loads(cached)
+    result = await db.execute(_GET_CONTACTS, {'uid': user.id, 'after': after_id or 0, 'lm': limit})
+    rows = [dict(row) for row in result.mappings().all()]
+    try:
+        await _redis.set(key, json.dumps(rows, default=str), ex=_PAGE_TTL)
+    except Exception as e:
+        print(e)
+    return rows
 
 
-async def get_contact(contact_id: int, user: User, db: Session) -> Contacts:
+async def get_contact(contact_id: int, user: User, db: AsyncSession) -> Contacts:
     """
     The get_contact function takes in a database session, contact_id, and user.
-    It then queries the database for a Contact with the given id and user_id.
-    If it finds one, it returns that Contact object.
+    It looks the contact up by primary key — served from the session's
+    identity map without SQL when already loaded — and checks ownership.
 
     :param contact_id: int: Specify the contact id
     :param user: User: Ensure that the user is logged in and has access to the contact
-    :param db: Session: Pass the database session to the function
+    :param db: AsyncSession: Pass the database session to the function
     :return: A contact object
     """
-    return db.query(Contacts).filter(and_(Contacts.id == contact_id, Contacts.user_id == user.id)).first()
+    contact = await db.get(Contacts, contact_id)
+    if contact is None or contact.user_id != user.id:
+        return None
+    return contact
 
 
-async def create_contact(body: ContactsModel, user: User, db: Session) -> Contacts:
+async def create_contact(body: ContactsModel, user: User, db: AsyncSession) -> Contacts:
     """
     The create_contact function creates a new contact in the database.
         Args:
@@ -45,39 +109,81 @@ async def create_contact(body: ContactsModel, user: User, db: Session) -> Contac
             
     :param body: ContactsModel: Create a new contact
     :param user: User: Get the user id from the user object
-    :param db: Session: Access the database
+    :param db: AsyncSession: Access the database
     :return: The newly created contact
     """
-    contact = Contacts(**body.dict(), user_id=user.id)
+    contact = Contacts(
+        first_name=body.first_name,
+        last_name=body.last_name,
+        email=body.email,
+        phone_number=body.phone_number,
+        born_date=body.born_date,
+        description=body.description,
+        done=body.done,
+        user_id=user.id,
+    )
     db.add(contact)
-    db.commit()
-    db.refresh(contact)
+    await db.commit()
+    await db.refresh(contact)
+    await _invalidate_pages(user.id)
     return contact
 
 
-async def update_contact(contact_id: int, body: ContactsModel, user: User,  db: Session) -> Contacts | None:
+async def create_contacts_bulk(bodies: List[ContactsModel], user: User, db: AsyncSession) -> List[Contacts]:
+    """
+    The create_contacts_bulk function inserts several contacts in one statement.
+    With executemany batching on the engine this costs two round-trips for the
+    whole list instead of one INSERT per contact.
+
+    :param bodies: List[ContactsModel]: The contacts to create
+    :param user: User: Get the user id from the user object
+    :param db: AsyncSession: Access the database
+    :return: The newly created contacts
+    """
+    if not bodies:
+        return []
+    rows = [body.model_dump() | {
+        'born_month': body.born_date.month,
+        'born_day': body.born_date.day,
+        'user_id': user.id,
+    } for body in bodies]
+    result = await db.execute(insert(Contacts).returning(Contacts), rows)
+    contacts = result.scalars().all()
+    await db.commit()
+    await _invalidate_pages(user.id)
+    return contacts
+
+
+async def update_contact(contact_id: int, body: ContactsModel, user: User,  db: AsyncSession) -> Contacts | None:
     """
     The update_contact function updates a contact in the database.
 
     :param contact_id: int: Find the contact in the database
     :param body: ContactsModel: Get the data from the request body
     :param user: User: Ensure that the user is only able to update their own contacts
-    :param db: Session: Access the database
+    :param db: AsyncSession: Access the database
     :return: The updated contact
     """
-    contact = db.query(Contacts).filter(
-        and_(Contacts.id == contact_id, Contacts.user_id == user.id)).first()
-    if contact:
-        contact.first_name = body.first_name
-        contact.last_name = body.last_name
-        contact.email = body.email
-        contact.phone_number = body.phone_number
-        contact.born_date = body.born_date
-        db.commit()
+    stmt = update(Contacts).where(
+        and_(Contacts.id == contact_id, Contacts.user_id == user.id)).values(
+        first_name=body.first_name,
+        last_name=body.last_name,
+        email=body.email,
+        phone_number=body.phone_number,
+        born_date=body.born_date,
+        born_month=body.born_date.month,
+        born_day=body.born_date.day,
+        description=body.description,
+        done=body.done,
+    ).returning(Contacts)
+    result = await db.execute(stmt)
+    contact = result.scalar_one_or_none()
+    await db.commit()
+    await _invalidate_pages(user.id)
     return contact
 
 
-async def remove_contact(contact_id: int,user: User, db: Session)  -> Contacts | None:
+async def remove_contact(contact_id: int,user: User, db: AsyncSession)  -> Contacts | None:
     """
     The remove_contact function deletes a contact from the database.
         Args:
@@ -87,63 +193,77 @@ async def remove_contact(contact_id: int,user: User, db: Session)  -> Contacts |
 
     :param contact_id: int: Specify the contact to delete
     :param user: User: Make sure that the user is authorized to delete the contact
-    :param db: Session: Pass the database session to the function
+    :param db: AsyncSession: Pass the database session to the function
     :return: The deleted contact
     """
-    contact = db.query(Contacts).filter(and_(Contacts.id == contact_id, Contacts.user_id == user.id)).first()
-    if contact:
-        db.delete(contact)
-        db.commit()
+    stmt = delete(Contacts).where(
+        and_(Contacts.id == contact_id, Contacts.user_id == user.id)).returning(Contacts)
+    result = await db.execute(stmt)
+    contact = result.scalar_one_or_none()
+    await db.commit()
+    await _invalidate_pages(user.id)
     return contact
 
-async def update_status_contact(contact_id: int, body: ContactsStatusUpdate, user: User, db: Session):
+async def update_status_contact(contact_id: int, body: ContactsStatusUpdate, user: User, db: AsyncSession):
     """
     The update_contact function updates a contact in the database.
 
     :param contact_id: int: Find the contact in the database
     :param body: ContactsStatusUpdate: Get the data from the request body
     :param user: User: Ensure that the user is only able to update their own contacts
-    :param db: Session: Access the database
+    :param db: AsyncSession: Access the database
     :return: The updated contact
     """
-    contact = db.query(Contacts).filter(and_(Contacts.id == contact_id, Contacts.user_id == user.id)).first()
-    if contact:
-        contact.done = body.done
-        db.commit()
+    stmt = update(Contacts).where(
+        and_(Contacts.id == contact_id, Contacts.user_id == user.id)).values(
+        done=body.done).returning(Contacts)
+    result = await db.execute(stmt)
+    contact = result.scalar_one_or_none()
+    await db.commit()
+    await _invalidate_pages(user.id)
     return contact
 
-def search_contacts(db: Session, query: str, user: User) -> List[Contacts]:
+async def search_contacts(db: AsyncSession, query: str, user: User) -> List[Contacts]:
     """
     The search_contacts function searches the database for contacts that match a given query.
 
-    :param db: Session: Access the database
+    :param db: AsyncSession: Access the database
     :param query: str: Search for a contact by first name, last name or email
     :param user: User: Get the user id of the current user
     :return: A list of contacts that match the query
     """
     if not query:
         return []
-    return db.query(Contacts).filter(Contacts.user_id == user.id).filter(or_(
-        Contacts.first_name.ilike(f"%{query}%"),
-        Contacts.last_name.ilike(f"%{query}%"),
-        Contacts.email.ilike(f"%{query}%"),
-    )).all()
+    result = await db.execute(_SEARCH_CONTACTS, {'uid': user.id, 'q': f"%{query}%"})
+    return result.scalars().all()
 
 
-async def get_contacts_with_birthdays(db: Session, user: User):
+async def get_contacts_with_birthdays(db: AsyncSession, user: User):
     """
     The get_contacts_with_birthdays function returns a list of contacts with birthdays in the next week.
+    The (month, day) window is compared as a tuple against the composite
+    (user_id, born_month, born_day) index, and a window crossing a month or
+    year boundary is split into two ranges.
 
-    :param db: Session: Pass in the database session
+    :param db: AsyncSession: Pass in the database session
     :param user: User: Get the user_id from the database
-    :return: A list of contact objects
+    :return: A list of contact rows
     """
     today = date.today()
     next_week = today + timedelta(days=7)
+    start = (today.month, today.day)
+    end = (next_week.month, next_week.day)
+
+    birthday = tuple_(Contacts.born_month, Contacts.born_day)
+    if start <= end:
+        condition = birthday.between(start, end)
+    else:
+        condition = or_(birthday >= start, birthday <= end)
 
-    contacts = db.query(Contacts).filter(Contacts.user_id == user.id).filter(
-        extract('month', Contacts.born_date) == today.month,
-        extract('day', Contacts.born_date) >= today.day,
-        extract('day', Contacts.born_date) <= next_week.day
-    ).all()
-    return contacts
\ No newline at end of file
+    stmt = select(
+        Contacts.id, Contacts.first_name, Contacts.last_name, Contacts.email,
+        Contacts.phone_number, Contacts.born_date, Contacts.description,
+        Contacts.done, Contacts.created_at
+    ).where(Contacts.user_id == user.id, condition)
+    result = await db.execute(stmt)
+    return result.all()
\ No newline at end of file
@@ -1,81 +1,83 @@
-from libgravatar import Gravatar
-from sqlalchemy.orm import Session
+import hashlib
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
 from src.schemas import UserModel
 
 
-async def get_user_by_email(email: str, db: Session) -> User:
+async def get_user_by_email(email: str, db: AsyncSession) -> User:
     """
     The get_user_by_email function takes in an email and a database session,
     and returns the user with that email. If no such user exists, it returns None.
 
     :param email: str: Specify the type of the parameter
-    :param db: Session: Pass the database session to the function
+    :param db: AsyncSession: Pass the database session to the function
     :return: A user object
     """
-    return db.query(User).filter(User.email == email).first()
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalars().first()
 
 
-async def create_user(body: UserModel, db: Session) -> User:
+async def create_user(body: UserModel, db: AsyncSession) -> User:
     """
     The create_user function creates a new user in the database.
+    The gravatar URL is derived locally from the email hash, so signup
+    does not wait on any outbound request.
 
     :param body: UserModel: Define the data that will be used to create a new user
-    :param db: Session: Pass the database session to the function
+    :param db: AsyncSession: Pass the database session to the function
     :return: A user object
     """
-    avatar = None
-    try:
-        g = Gravatar(body.email)
-        avatar = g.get_image()
-    except Exception as e:
-        print(e)
-    new_user = User(**body.dict(), avatar=avatar)
+    email_hash = hashlib.md5(body.email.strip().lower().encode()).hexdigest()
+    avatar = f"https://www.gravatar.com/avatar/{email_hash}?d=identicon"
+    new_user = User(**body.model_dump(), avatar=avatar)
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     return new_user
 
 
-async def update_token(user: User, token: str | None, db: Session) -> None:
+async def update_token(user: User, token: str | None, db: AsyncSession) -> None:
     """
     The update_token function updates the refresh token for a user.
 
     :param user: User: Identify the user
     :param token: Optional[str]: Pass in the token that is returned from the spotify api
-    :param db: Session: Pass the database session to the function
+    :param db: AsyncSession: Pass the database session to the function
     :return: None
     """
     user.refresh_token = token
-    db.commit()
+    await db.commit()
 
 
-async def confirmed_email(email: str, db: Session) -> None:
+async def confirmed_email(email: str, db: AsyncSession) -> None:
     """
     The confirmed_email function takes in an email and a database session.
-    It then gets the user by their email, sets their confirmed status to True,
-    and commits the changes to the database.
+    It flips the user's confirmed flag with a single UPDATE, without
+    loading the row first.
 
     :param email: str: Specify the email of the user to be confirmed
-    :param db: Session: Pass in the database session to the function
+    :param db: AsyncSession: Pass in the database session to the function
     :return: None
     """
-    user = await get_user_by_email(email, db)
-    user.confirmed = True
-    db.commit()
+    await db.execute(update(User).where(User.email == email).values(confirmed=True))
+    await db.commit()
 
 
-async def update_avatar(email, url: str, db: Session) -> User:
+async def update_avatar(email, url: str, db: AsyncSession) -> User:
     """
-    The update_avatar function updates the avatar of a user.
+    The update_avatar function updates the avatar of a user with a single
+    UPDATE ... RETURNING statement.
 
     :param email: Find the user in the database
     :param url: str: Specify the type of data that will be passed to the function
-    :param db: Session: Pass the database session to the function
+    :param db: AsyncSession: Pass the database session to the function
     :return: The user object, which is a row in the users table
     """
-    user = await get_user_by_email(email, db)
-    user.avatar = url
-    db.commit()
+    result = await db.execute(
+        update(User).where(User.email == email).values(avatar=url).returning(User))
+    user = result.scalar_one_or_none()
+    await db.commit()
     return user
\ No newline at end of file
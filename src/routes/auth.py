@@ -2,7 +2,7 @@ from typing import List
 
 from fastapi import APIRouter, HTTPException, Depends, status, Security, BackgroundTasks, Request
 from fastapi.security import HTTPBearer, OAuth2PasswordRequestForm, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
 from src.schemas import UserModel, UserDb, UserResponse, TokenModel, RequestEmail
@@ -16,7 +16,7 @@ security = HTTPBearer()
 
 
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def signup(body: UserModel, background_tasks: BackgroundTasks, request: Request, db: Session = Depends(get_db)):
+async def signup(body: UserModel, background_tasks: BackgroundTasks, request: Request, db: AsyncSession = Depends(get_db)):
     """
     The signup function creates a new user in the database.
         It also sends an email to the user's email address for confirmation.
@@ -26,7 +26,7 @@ async def signup(body: UserModel, background_tasks: BackgroundTasks, request: Re
     :param body: UserModel: Get the data from the request body
     :param background_tasks: BackgroundTasks: Add a task to the background tasks queue
     :param request: Request: Get the base url of the server
-    :param db: Session: Get the database session
+    :param db: AsyncSession: Get the database session
     :return: A dict with the new user and a message
     """
     exist_user =await repository_users.get_user_by_email(body.email, db)
@@ -34,17 +34,17 @@ async def signup(body: UserModel, background_tasks: BackgroundTasks, request: Re
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Account already exist")
     body.password = auth_servise.get_password_hash(body.password)
     new_user = await repository_users.create_user(body, db)
-    background_tasks.add_task(send_email, new_user.email, new_user.username, request.base_url)
+    background_tasks.add_task(send_email, new_user.email, new_user.username, str(request.base_url))
     return {"user": new_user, "detail": "User successfully created. Check your email for confirmation."}
 
 
 @router.post('/login', response_model=TokenModel)
-async def login(body: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(body: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)):
     """
     The login function is used to authenticate a user.
     
     :param body: OAuth2PasswordRequestForm: Get the username and password from the request
-    :param db: Session: Get a database session
+    :param db: AsyncSession: Get a database session
     :return: An access token and a refresh token
     """
     user = await repository_users.get_user_by_email(body.username, db)
@@ -62,13 +62,13 @@ async def login(body: OAuth2PasswordRequestForm = Depends(), db: Session = Depen
 
 
 @router.post("/refresh_token", response_model=TokenModel)
-async def refresh_token(credentials: HTTPAuthorizationCredentials = Security(security), db: Session = Depends(get_db)):
+async def refresh_token(credentials: HTTPAuthorizationCredentials = Security(security), db: AsyncSession = Depends(get_db)):
     """
     The refresh_token function is used to refresh the access token.
     It takes in a refresh token and returns a new access_token, refresh_token, and token type.
     
     :param credentials: HTTPAuthorizationCredentials: Get the credentials from the request header
-    :param db: Session: Get the database session
+    :param db: AsyncSession: Get the database session
     :return: A dictionary with the access_token, refresh_token and token type
     """
     token = credentials.credentials
@@ -87,7 +87,7 @@ async def refresh_token(credentials: HTTPAuthorizationCredentials = Security(sec
 
 @router.post('/request_email')
 async def request_email(body: RequestEmail, background_tasks: BackgroundTasks, request: Request,
-                        db: Session = Depends(get_db)):
+                        db: AsyncSession = Depends(get_db)):
     """
     The request_email function is used to send an email to the user with a link that will allow them
     to confirm their email address. The function takes in a RequestEmail object, which contains the
@@ -97,7 +97,7 @@ async def request_email(body: RequestEmail, background_tasks: BackgroundTasks, r
     :param body: RequestEmail: Get the email from the request body
     :param background_tasks: BackgroundTasks: Add a task to the background tasks queue
     :param request: Request: Get the base_url of the application
-    :param db: Session: Get the database session
+    :param db: AsyncSession: Get the database session
     :return: A dictionary with a message
     """
     user = await repository_users.get_user_by_email(body.email, db)
@@ -105,19 +105,19 @@ async def request_email(body: RequestEmail, background_tasks: BackgroundTasks, r
     if user.confirmed:
         return {"message": "Your email is already confirmed"}
     if user:
-        background_tasks.add_task(send_email, user.email, user.username, request.base_url)
+        background_tasks.add_task(send_email, user.email, user.username, str(request.base_url))
     return {"message": "Check your email for confirmation."}
 
 
 @router.get('/confirmed_email/{token}')
-async def confirmed_email(token: str, db: Session = Depends(get_db)):
+async def confirmed_email(token: str, db: AsyncSession = Depends(get_db)):
     """
     The confirmed_email function is used to confirm a user's email address.
         The function takes the token from the URL and uses it to get the user's email address.
         It then checks if that user exists in our database, and if they do, it confirms their email.
     
     :param token: str: Get the token from the url
-    :param db: Session: Get the database connection
+    :param db: AsyncSession: Get the database connection
     :return: A dict with a message, but the response is not returned to the client
     """
     email = await auth_servise.get_email_from_token(token)
@@ -2,7 +2,7 @@ from typing import List
 
 from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi_limiter.depends import RateLimiter
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
 from src.database.models import User
@@ -15,24 +15,24 @@ router = APIRouter(prefix='/contacts', tags=["contacts"])
 
 @router.get("/", response_model=List[ContactsResponse], description='No more than 10 requests per minute',
             dependencies=[Depends(RateLimiter(times=10, seconds=60))])
-async def read_contacts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db),
+async def read_contacts(after_id: int | None = None, limit: int = 100, db: AsyncSession = Depends(get_db),
                      current_user: User = Depends(auth_servise.get_current_user)):
     """
-    Returns a list of contacts.
-    It takes in an optional skip and limit parameter to paginate the results.
+    Returns a page of contacts ordered by id.
+    Pass the last id of the previous page as after_id to get the next page.
 
-    :param skip: int: Skip the first n contacts
+    :param after_id: int | None: Return contacts with an id greater than this
     :param limit: int: Limit the number of contacts returned
-    :param db: Session: Pass the database session to the repository layer
+    :param db: AsyncSession: Pass the database session to the repository layer
     :param current_user: User: Get the current user
     :return: A list of contact objects
     """
-    contacts = await repository_contacts.get_contacts(skip, limit, current_user, db)
+    contacts = await repository_contacts.get_contacts(after_id, limit, current_user, db)
     return contacts
 
 
 @router.get("/{contacts_id}", response_model=ContactsResponse)
-async def read_contact(contacts_id: int, db: Session = Depends(get_db),
+async def read_contact(contacts_id: int, db: AsyncSession = Depends(get_db),
                         current_user: User = Depends(auth_servise.get_current_user)):
     """
     Returns a contact by its id.
@@ -40,7 +40,7 @@ async def read_contact(contacts_id: int, db: Session = Depends(get_db),
     If the user is logged in but does not have access to this contact, it will return an error message.
 
     :param contact_id: int: Identify the contact that is to be read
-    :param db: Session: Get the database session
+    :param db: AsyncSession: Get the database session
     :param current_user: User: Get the current user from the auth_service
     :return: A contact object
     """
@@ -52,22 +52,38 @@ async def read_contact(contacts_id: int, db: Session = Depends(get_db),
 
 @router.post("/", response_model=ContactsResponse, description='No more than 10 requests per minute',
             dependencies=[Depends(RateLimiter(times=10, seconds=60))])
-async def create_contact(body: ContactsModel, db: Session = Depends(get_db),
+async def create_contact(body: ContactsModel, db: AsyncSession = Depends(get_db),
                          current_user: User = Depends(auth_servise.get_current_user)):
     """
     Creates a new contact in the database.
     The function takes a ContactModel object as input, and returns the newly created contact.
 
     :param body: ContactModel: Validate the data that is passed to the function
-    :param db: Session: Get the database connection from the dependency injection
+    :param db: AsyncSession: Get the database connection from the dependency injection
     :param current_user: User: Get the user_id from the token
     :return: A contactmodel object, which is a pydantic model
     """
     return await repository_contacts.create_contact(body,current_user, db)
 
 
+@router.post("/bulk", response_model=List[ContactsResponse], description='No more than 10 requests per minute',
+            dependencies=[Depends(RateLimiter(times=10, seconds=60))])
+async def create_contacts_bulk(body: List[ContactsModel], db: AsyncSession = Depends(get_db),
+                               current_user: User = Depends(auth_servise.get_current_user)):
+    """
+    Creates several contacts in one request.
+    The whole list is written with a single batched INSERT.
+
+    :param body: List[ContactsModel]: Validate the contacts passed in the request body
+    :param db: AsyncSession: Get the database connection from the dependency injection
+    :param current_user: User: Get the user_id from the token
+    :return: A list of the created contacts
+    """
+    return await repository_contacts.create_contacts_bulk(body, current_user, db)
+
+
 @router.put("/{contact_id}", response_model=ContactsResponse)
-async def update_contact(body: ContactsModel, contact_id: int, db: Session = Depends(get_db),
+async def update_contact(body: ContactsModel, contact_id: int, db: AsyncSession = Depends(get_db),
                          current_user: User = Depends(auth_servise.get_current_user)):
     contact = await repository_contacts.update_contact(contact_id, body, current_user, db)
     if contact is None:
@@ -75,7 +91,7 @@ async def update_contact(body: ContactsModel, contact_id: int, db: Session = Dep
     return contact
 
 @router.patch("/{note_id}", response_model=ContactsResponse)
-async def update_status_note(body: ContactsStatusUpdate, contact_id: int, db: Session = Depends(get_db),
+async def update_status_note(body: ContactsStatusUpdate, contact_id: int, db: AsyncSession = Depends(get_db),
                              current_user: User = Depends(auth_servise.get_current_user)):
     """
     Updates a contact in the database.
@@ -88,7 +104,7 @@ async def update_status_note(body: ContactsStatusUpdate, contact_id: int, db: Se
 
     :param body: ContactModel: Pass the contact information to be updated
     :param contact_id: int: Identify the contact to be updated
-    :param db: Session: Pass the database session to the repository layer
+    :param db: AsyncSession: Pass the database session to the repository layer
     :param current_user: User: Get the current user from the auth_service
     :return: A contactmodel object
     """
@@ -99,7 +115,7 @@ async def update_status_note(body: ContactsStatusUpdate, contact_id: int, db: Se
 
 
 @router.delete("/{contact_id}", response_model=ContactsResponse)
-async def remove_contact(contact_id: int, db: Session = Depends(get_db),
+async def remove_contact(contact_id: int, db: AsyncSession = Depends(get_db),
                          current_user: User = Depends(auth_servise.get_current_user)):
     """
     Removes a contact from the database.
@@ -107,7 +123,7 @@ async def remove_contact(contact_id: int, db: Session = Depends(get_db),
     and returns a dictionary containing information about that contact.
 
     :param contact_id: int: Specify the contact id of the contact to be removed
-    :param db: Session: Get the database session
+    :param db: AsyncSession: Get the database session
     :param current_user: User: Get the current user from the database
     :return: A contact object
     """
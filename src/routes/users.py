@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, status, UploadFile, File
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import cloudinary
 import cloudinary.uploader
 
@@ -27,7 +27,7 @@ async def read_users_me(current_user: User = Depends(auth_servise.get_current_us
 
 @router.patch('/avatar', response_model=UserDb)
 async def update_avatar_user(file: UploadFile = File(), current_user: User = Depends(auth_servise.get_current_user),
-                             db: Session = Depends(get_db)):
+                             db: AsyncSession = Depends(get_db)):
     """
     The update_avatar_user function is used to update the avatar of a user.
         The function takes in an UploadFile object, which contains the file that will be uploaded to Cloudinary.
@@ -36,7 +36,7 @@ async def update_avatar_user(file: UploadFile = File(), current_user: User = Dep
 
     :param file: UploadFile: Upload the file to cloudinary
     :param current_user: User: Get the current user's information
-    :param db: Session: Access the database
+    :param db: AsyncSession: Access the database
     :return: The updated user object
     """
     cloudinary.config(
@@ -1,22 +1,23 @@
 from datetime import datetime, date
 from typing import List, Optional
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 
 
 class ContactsModel(BaseModel):
     first_name: str
     last_name: str
     email: EmailStr
-    phone_number: str
+    phone_number: str = Field(pattern=r'^\+?\d{6,20}$')
     born_date: date
+    description: Optional[str] = None
+    done: bool = False
 
 
 class ContactsResponse(ContactsModel):
     id: int
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ContactsStatusUpdate(BaseModel):
     done: bool
@@ -38,8 +39,7 @@ class UserDb(BaseModel):
     created_at: datetime
     avatar: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserResponse(BaseModel):
@@ -3,12 +3,14 @@ import redis
 
 from typing import Optional
 
+from cachetools import TTLCache
+
 from jose import jwt, JWTError
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
 from src.repository import users as repository_users
@@ -21,6 +23,9 @@ class Auth:
     ALOGORITHM = settings.algorithm
     oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
     r = redis.Redis(host=settings.redis_host, port=settings.redis_port, db=0)
+    # In-process cache keyed by the raw bearer token; the short TTL bounds
+    # how long a revoked or expired token can keep serving a cached user.
+    user_cache = TTLCache(maxsize=10_000, ttl=30)
 
 
     def verify_password(self, plain_password, hashed_password):
@@ -99,7 +104,7 @@ class Auth:
         except JWTError:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
         
-    async def get_current_user(self, token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    async def get_current_user(self, token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
         """
         It is a dependency that will be called by the FastAPI framework to retrieve the current user.
 
@@ -114,8 +119,12 @@ class Auth:
             headers={"WWW-Authenticate": "Bearer"}
         )
 
+        cached_user = self.user_cache.get(token)
+        if cached_user is not None:
+            return cached_user
+
         try:
-            payload = jwt.encode(token, self.SECRET_KEY, algorithm=self.ALOGORITHM)
+            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALOGORITHM])
             if payload["scope"] == "access_token":
                 email = payload["sub"]
                 if email is None:
@@ -133,6 +142,7 @@ class Auth:
             self.r.expire(f"user:{email}", 900)
         else:
             user = pickle.loads(user)
+        self.user_cache[token] = user
         return user
     
 
@@ -11,7 +11,7 @@ from src.conf.config import settings
 conf = ConnectionConfig(
     MAIL_USERNAME=settings.mail_username,
     MAIL_PASSWORD=settings.mail_password,
-    MAIL_FROM=EmailStr(settings.mail_from),
+    MAIL_FROM=settings.mail_from,
     MAIL_PORT=settings.mail_port,
     MAIL_SERVER=settings.mail_server,
     MAIL_FROM_NAME="Desired Name",
@@ -22,6 +22,10 @@ conf = ConnectionConfig(
     TEMPLATE_FOLDER=Path(__file__).parent / 'templates',
 )
 
+# One client for the whole process; building FastMail per message redid the
+# config validation and template-environment setup on every send.
+fm = FastMail(conf)
+
 
 async def send_email(email: EmailStr, username: str, host: str):
     """
@@ -45,7 +49,6 @@ async def send_email(email: EmailStr, username: str, host: str):
             subtype=MessageType.html
         )
 
-        fm = FastMail(conf)
         await fm.send_message(message, template_name="email_template.html")
     except ConnectionErrors as err:
         print(err)
@@ -1,29 +1,43 @@
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from main import app
 from src.database.models import Base
 from src.database.db import get_db
 
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=NullPool
+)
+TestingSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+# Sync engine on the same file so fixtures can inspect and tweak rows directly.
+sync_engine = create_engine(
+    "sqlite:///./test.db", connect_args={"check_same_thread": False}
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SyncSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
 
 
 @pytest.fixture(scope="module")
 def session():
     # Create the database
 
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
+    async def init_models():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(init_models())
 
-    db = TestingSessionLocal()
+    db = SyncSessionLocal()
     try:
         yield db
     finally:
@@ -34,11 +48,9 @@ def session():
 def client(session):
     # Dependency override
 
-    def override_get_db():
-        try:
-            yield session
-        finally:
-            session.close()
+    async def override_get_db():
+        async with TestingSessionLocal() as db:
+            yield db
 
     app.dependency_overrides[get_db] = override_get_db
 
@@ -47,4 +59,4 @@ def client(session):
 
 @pytest.fixture(scope="module")
 def user():
-    return {"username": "deadpool", "email": "deadpool@example.com", "password": "123456789"}
\ No newline at end of file
+    return {"username": "deadpool", "email": "deadpool@example.com", "password": "123456789"}
@@ -1,15 +1,16 @@
 import unittest
 from datetime import date, datetime
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
-from src.database.models import Contacts, User
+from src.database.models import Base, Contacts, User
 from src.schemas import ContactsModel, ContactsUpdate, ContactsStatusUpdate
 from src.repository.contacts import (
     get_contact,
     get_contacts,
     create_contact,
+    create_contacts_bulk,
     remove_contact,
     update_contact,
     update_status_contact,
@@ -19,23 +20,76 @@ from src.repository.contacts import (
 class TestContacts(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
-        self.session = MagicMock(spec=Session)
+        self.session = MagicMock(spec=AsyncSession)
+        self.session.execute.return_value = MagicMock()
         self.user = User(id=1)
+        self.redis = AsyncMock()
+        self.redis.get.return_value = None
+        self.redis.scan_iter = MagicMock(side_effect=lambda pattern: self._aiter([]))
+        patcher = patch('src.repository.contacts._redis', self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    async def _aiter(items):
+        for item in items:
+            yield item
 
     async def test_get_contacts(self):
-        contacts = [Contacts(), Contacts(), Contacts()]
-        self.session.query().filter().offset().limit().all.return_value = contacts
-        result = await get_contacts(skip=0, limit=3, user=self.user, db=self.session)
+        contacts = [{"id": 1}, {"id": 2}, {"id": 3}]
+        self.session.execute.return_value.mappings.return_value.all.return_value = contacts
+        result = await get_contacts(after_id=None, limit=3, user=self.user, db=self.session)
+        self.assertEqual(result, contacts)
+
+    async def test_get_contacts_returns_description_and_done(self):
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            session.add(Contacts(
+                first_name="Taras",
+                last_name="Shevchenko",
+                email="hfhghgc@gmail.com",
+                phone_number="803123123",
+                born_date=date(2005, 2, 3),
+                description="poet",
+                done=True,
+                user_id=self.user.id,
+            ))
+            await session.commit()
+            result = await get_contacts(after_id=None, limit=10, user=self.user, db=session)
+        await engine.dispose()
+        self.assertEqual(result[0]["description"], "poet")
+        self.assertTrue(result[0]["done"])
+
+    async def test_get_contacts_cached(self):
+        self.redis.get.return_value = '[{"id": 1}]'
+        result = await get_contacts(after_id=None, limit=3, user=self.user, db=self.session)
+        self.assertEqual(result, [{"id": 1}])
+        self.session.execute.assert_not_called()
+
+    async def test_get_contacts_redis_down(self):
+        contacts = [{"id": 1}, {"id": 2}]
+        self.redis.get.side_effect = ConnectionError("redis is down")
+        self.redis.set.side_effect = ConnectionError("redis is down")
+        self.session.execute.return_value.mappings.return_value.all.return_value = contacts
+        result = await get_contacts(after_id=None, limit=3, user=self.user, db=self.session)
         self.assertEqual(result, contacts)
 
     async def test_get_contact_found(self):
-        contact = Contacts()
-        self.session.query().filter().first.return_value = contact
+        contact = Contacts(user_id=self.user.id)
+        self.session.get.return_value = contact
         result = await get_contact(contact_id=1, user=self.user, db=self.session)
         self.assertEqual(result, contact)
 
     async def test_get_contact_not_found(self):
-        self.session.query().filter().first.return_value = None
+        self.session.get.return_value = None
+        result = await get_contact(contact_id=1, user=self.user, db=self.session)
+        self.assertIsNone(result)
+
+    async def test_get_contact_wrong_user(self):
+        self.session.get.return_value = Contacts(user_id=self.user.id + 1)
         result = await get_contact(contact_id=1, user=self.user, db=self.session)
         self.assertIsNone(result)
 
@@ -55,6 +109,42 @@ class TestContacts(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.born_date, body.born_date)
         self.assertTrue(hasattr(result, "id"))
 
+    async def test_create_contacts_bulk(self):
+        bodies = [
+            ContactsModel(
+                first_name="Taras",
+                last_name="Shevchenko",
+                email="hfhghgc@gmail.com",
+                phone_number="803123123",
+                born_date=date(2005, 2, 3)
+            ),
+            ContactsModel(
+                first_name="Andriy",
+                last_name="Shevchenko",
+                email="sheva7@gmail.com",
+                phone_number="803123124",
+                born_date=date(1976, 9, 29)
+            ),
+        ]
+        created = [Contacts(), Contacts()]
+        self.session.execute.return_value.scalars.return_value.all.return_value = created
+        result = await create_contacts_bulk(bodies=bodies, user=self.user, db=self.session)
+        self.assertEqual(result, created)
+        rows = self.session.execute.call_args.args[1]
+        self.assertEqual(len(rows), 2)
+        for body, row in zip(bodies, rows):
+            self.assertEqual(row["first_name"], body.first_name)
+            self.assertEqual(row["born_month"], body.born_date.month)
+            self.assertEqual(row["born_day"], body.born_date.day)
+            self.assertEqual(row["user_id"], self.user.id)
+            self.assertNotIn("created_at", row)
+        self.session.commit.assert_called_once()
+
+    async def test_create_contacts_bulk_empty(self):
+        result = await create_contacts_bulk(bodies=[], user=self.user, db=self.session)
+        self.assertEqual(result, [])
+        self.session.execute.assert_not_called()
+
     async def test_update_contact_found(self):
         body = ContactsModel(
             first_name="Taras",
@@ -70,7 +160,7 @@ class TestContacts(unittest.IsolatedAsyncioTestCase):
             phone_number="803123123",
             born_date=date(2005, 2, 3)
         )
-        self.session.query().filter().first.return_value = contact
+        self.session.execute.return_value.scalar_one_or_none.return_value = contact
         self.session.commit.return_value = None
         result = await update_contact(contact_id=1, body=body, user=self.user, db=self.session)
         self.assertEqual(result, contact)
@@ -83,27 +173,27 @@ class TestContacts(unittest.IsolatedAsyncioTestCase):
             phone_number="803123123",
             born_date=date(2005, 2, 3)
         )
-        self.session.query().filter().first.return_value = None
+        self.session.execute.return_value.scalar_one_or_none.return_value = None
         self.session.commit.return_value = None
         result = await update_contact(contact_id=1, body=body, user=self.user, db=self.session)
         self.assertIsNone(result)
 
     async def test_remove_contact_found(self):
         contact = Contacts()
-        self.session.query().filter().first.return_value = contact
+        self.session.execute.return_value.scalar_one_or_none.return_value = contact
         result = await remove_contact(contact_id=1, user=self.user, db=self.session)
         self.assertEqual(result, contact)
 
     async def test_remove_contact_not_found(self):
-        self.session.query().filter().first.return_value = None
+        self.session.execute.return_value.scalar_one_or_none.return_value = None
         result = await remove_contact(contact_id=1, user=self.user, db=self.session)
         self.assertIsNone(result)
 
     async def test_get_contact_by_birthday_found(self):
         contact = [Contacts(born_date=date(datetime.now().year, datetime.now().month, datetime.now().day))]
-        self.session.query().filter().all.return_value = contact
+        self.session.execute.return_value.all.return_value = contact
         result = await get_contacts_with_birthdays(db=self.session, user=self.user)
-        self.assertNotEqual(result, contact)
+        self.assertEqual(result, contact)
 
 
 
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import MagicMock
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
 from src.schemas import UserModel
@@ -17,7 +17,8 @@ from src.repository.users import (
 class TestUsers(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
-        self.session = MagicMock(spec=Session)
+        self.session = MagicMock(spec=AsyncSession)
+        self.session.execute.return_value = MagicMock()
         self.user = User(id=1)
         self.body = UserModel(
             username="Userus",
@@ -26,12 +27,12 @@ class TestUsers(unittest.IsolatedAsyncioTestCase):
         )
 
     async def test_get_user_by_email_found(self):
-        self.session.query().filter().first.return_value = self.user
+        self.session.execute.return_value.scalars.return_value.first.return_value = self.user
         result = await get_user_by_email(email=self.user.email, db=self.session)
         self.assertEqual(result, self.user)
 
     async def test_get_user_by_email_not_found(self):
-        self.session.query().filter().first.return_value = None
+        self.session.execute.return_value.scalars.return_value.first.return_value = None
         result = await get_user_by_email(email=self.user.email, db=self.session)
         self.assertIsNone(result)
 
@@ -42,20 +43,20 @@ class TestUsers(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.password, self.body.password)
 
     async def test_update_token(self):
-        self.session.query().filter().first.return_value = self.user
+        self.session.execute.return_value.scalars.return_value.first.return_value = self.user
         token = "token"
         await update_token(user=self.user, token=token, db=self.session)
         self.assertTrue(self.user.refresh_token)
         self.assertEqual(self.user.refresh_token, token)
 
     async def test_confirmed_email(self):
-        self.session.query().filter().first.return_value = self.user
         await confirmed_email(email=self.user.email, db=self.session)
-        self.assertTrue(self.user.confirmed)
+        self.session.execute.assert_called_once()
+        self.session.commit.assert_called_once()
 
     async def test_update_avatar(self):
-        self.session.query().filter().first.return_value = self.user
         url = "http://someurl.jpeg"
+        self.session.execute.return_value.scalar_one_or_none.return_value = User(id=1, avatar=url)
         result = await update_avatar(email=self.user.email, url=url, db=self.session)
         self.assertEqual(result.avatar, url)
 